@@ -22,6 +22,7 @@ import os
 import re
 import sys
 import tempfile
+import traceback
 import unittest
 
 from . import utils
@@ -154,6 +155,71 @@ class TestGenerator(object):
         return structures, setups, teardowns
 
 
+def _make_failed_test(filepath, message):
+    """Make a suite with one test which reports why filepath failed to load"""
+    def test_failure(self):
+        raise ImportError(message)
+    name = utils.snakify(os.path.splitext(os.path.basename(filepath))[0])
+    failed_class = type('SpecLoadFailure', (unittest.TestCase,),
+                        {name: test_failure})
+    return unittest.TestSuite((failed_class(name),))
+
+
+class LazyTestSuite(unittest.TestSuite):
+    """A unittest.TestSuite which loads one module at a time.
+
+    Each test file is generated, imported and run only when the suite reaches
+    it, and the module is released again before moving on, so the tests from
+    only one spec file are held in memory at once. A spec which fails to
+    generate or import is reported as an error instead of stopping the run.
+
+    Since nothing is loaded up front, countTestCases has to generate and
+    import every spec file, and no further tests can be added to the suite.
+    """
+    def __init__(self, generator, loader=None):
+        """generator is the SuiteGenerator which creates the test files"""
+        unittest.TestSuite.__init__(self)
+        self.generator = generator
+        self.loader = loader if loader is not None else unittest.TestLoader()
+
+    def addTest(self, test):
+        raise TypeError("Tests cannot be added to a LazyTestSuite")
+
+    def __iter__(self):
+        for indir, infile in self.generator.spec_files():
+            try:
+                filepath = self.generator.create_test_file(indir, infile)
+                if filepath is None:
+                    continue
+                module = utils.create_module_from_file(filepath)
+            except Exception:
+                message = "Failed to load spec file: %s\n%s" % (
+                    infile, traceback.format_exc())
+                yield _make_failed_test(infile, message)
+                continue
+            try:
+                yield self.loader.loadTestsFromModule(module)
+            finally:
+                utils.release_module(module)
+                del module
+
+    def run(self, result, debug=False):
+        # Each module's suite runs as its own top-level suite, so that class
+        # and module fixtures are torn down before the module is released.
+        if result.shouldStop:
+            return result
+        for suite in self:
+            suite.run(result, debug)
+            del suite
+            # The suite has already torn down its own fixtures, so stop the
+            # next module's suite from tearing them down again.
+            result._previousTestClass = None
+            result._moduleSetUpFailed = False
+            if result.shouldStop:
+                break
+        return result
+
+
 class SuiteGenerator(object):
     """Generate python test files or a unittest.TestSuite"""
     SUFFIX = ".carinata"
@@ -173,36 +239,40 @@ class SuiteGenerator(object):
                     if os.path.splitext(filename)[1] == self.SUFFIX:
                         yield directory, os.path.join(root, filename)
 
-    def create_test_files(self):
-        """Create python test files from the spec files"""
-        filepaths = []
-        for indir, infile in self.spec_files():
-            if self.clean:
-                outdir, outfile = self._get_output(indir, infile)
-                try:
-                    os.remove(outfile)
-                except OSError:
-                    pass
-                continue
+    def create_test_file(self, indir, infile):
+        """Create a python test file from one spec file and return its path.
+
+        If cleaning, remove the test file instead and return None.
+        """
+        if self.clean:
+            outdir, outfile = self._get_output(indir, infile)
             try:
-                with self.output_file(indir, infile) as outfile:
-                    test = TestGenerator(infile, outfile)
-                    test.process()
-                path = outfile.name
-            except utils.FileHashMatch as hash_match:
-                path = hash_match.filename
-            filepaths.append(path)
+                os.remove(outfile)
+            except OSError:
+                pass
+            return None
+        try:
+            with self.output_file(indir, infile) as outfile:
+                test = TestGenerator(infile, outfile)
+                test.process()
+            return outfile.name
+        except utils.FileHashMatch as hash_match:
+            return hash_match.filename
+
+    def iter_test_files(self):
+        """Create python test files from the spec files, one at a time"""
+        for indir, infile in self.spec_files():
+            path = self.create_test_file(indir, infile)
+            if path is not None:
+                yield path
 
-        return filepaths
+    def create_test_files(self):
+        """Create python test files from the spec files"""
+        return list(self.iter_test_files())
 
     def create_test_suite(self):
-        """Create a unittest suite from the spec files"""
-        suite, loader = unittest.TestSuite(), unittest.TestLoader()
-        filepaths = self.create_test_files()
-        for filepath in filepaths:
-            test = utils.create_module_from_file(filepath)
-            suite.addTest(loader.loadTestsFromModule(test))
-        return suite
+        """Create a lazy unittest suite from the spec files"""
+        return LazyTestSuite(self)
 
     def _get_output(self, indir, infile):
         outdir = self.output_dir if self.output_dir else self.TEMPDIR
@@ -242,12 +312,10 @@ def main(directories, output_dir, generate, force, clean):
     """
     generator = SuiteGenerator(directories, output_dir, force, clean)
 
-    if generate:
+    if generate or clean:
         generator.create_test_files()
     else:
-        suite = generator.create_test_suite()
-        if not clean:
-            unittest.TextTestRunner().run(suite)
+        unittest.TextTestRunner().run(generator.create_test_suite())
 
 
 def parse_args():
@@ -49,6 +49,11 @@ def create_module_from_file(filepath):
     return __import__(name)
 
 
+def release_module(module):
+    """Forget a module imported by create_module_from_file"""
+    sys.modules.pop(module.__name__, None)
+
+
 def uuid_hex(length=6):
     return "_x" + uuid.uuid4().hex[:length]
 
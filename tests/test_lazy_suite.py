@@ -0,0 +1,165 @@
+"""Check that LazyTestSuite loads and releases one spec module at a time.
+
+Run with python 2: python -m unittest discover tests
+"""
+import gc
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+import weakref
+
+from carinata import SuiteGenerator
+
+
+SPEC = '''\
+from unittest import TestCase
+
+describe "Lazy spec {0}":
+    it "passes":
+        self.assertTrue(True)
+'''
+
+BAD_SPEC = '''\
+import nonexistent_module_for_carinata
+'''
+
+FAILING_SPEC = '''\
+from unittest import TestCase
+
+describe "Failing spec":
+    it "fails":
+        self.fail()
+'''
+
+FIXTURE_SPEC = '''\
+from lazy_fixture_calls import CountingTestCase as TestCase
+
+describe "Fixture spec {0}":
+    it "passes":
+        self.assertTrue(True)
+'''
+
+FIXTURE_MODULE = '''\
+import unittest
+
+CALLS = []
+
+
+class CountingTestCase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        CALLS.append(("setUpClass", cls.__name__))
+
+    @classmethod
+    def tearDownClass(cls):
+        CALLS.append(("tearDownClass", cls.__name__))
+'''
+
+
+class RecordingResult(unittest.TestResult):
+    """Record which generated test classes are still alive at each test"""
+    def __init__(self, output_dir):
+        unittest.TestResult.__init__(self)
+        self.output_dir = output_dir
+        self.classes = []
+        self.most_alive = 0
+        self.files_at_first_test = None
+
+    def startTest(self, test):
+        unittest.TestResult.startTest(self, test)
+        if self.files_at_first_test is None:
+            self.files_at_first_test = [f for f in os.listdir(self.output_dir)
+                                        if f.endswith(".py")]
+        gc.collect()
+        self.classes.append(weakref.ref(type(test)))
+        alive = set(ref() for ref in self.classes if ref() is not None)
+        self.most_alive = max(self.most_alive, len(alive))
+
+
+class LazyTestSuiteTest(unittest.TestCase):
+    count = 5
+
+    def setUp(self):
+        self.spec_dir = tempfile.mkdtemp()
+        self.output_dir = tempfile.mkdtemp()
+        for i in range(self.count):
+            self.write_spec("lazy_spec_{0}".format(i), SPEC.format(i))
+
+    def tearDown(self):
+        sys.modules.pop("lazy_fixture_calls", None)
+        shutil.rmtree(self.spec_dir)
+        shutil.rmtree(self.output_dir)
+
+    def write_spec(self, name, contents):
+        with open(os.path.join(self.spec_dir, name + ".carinata"), 'w') as f:
+            f.write(contents)
+
+    def run_suite(self, failfast=False, directories=None):
+        generator = SuiteGenerator(directories or [self.spec_dir],
+                                   self.output_dir)
+        result = RecordingResult(self.output_dir)
+        result.failfast = failfast
+        generator.create_test_suite().run(result)
+        return result
+
+    def test_generates_only_the_first_file_before_the_first_test(self):
+        result = self.run_suite()
+        self.assertEqual(len(result.files_at_first_test), 1)
+
+    def test_keeps_only_the_current_module_alive(self):
+        result = self.run_suite()
+        self.assertEqual(result.testsRun, self.count)
+        self.assertEqual(result.most_alive, 1)
+
+    def test_releases_modules_after_the_run(self):
+        result = self.run_suite()
+        gc.collect()
+        self.assertEqual([ref for ref in result.classes if ref() is not None],
+                         [])
+        for i in range(self.count):
+            self.assertFalse("lazy_spec_{0}".format(i) in sys.modules)
+
+    def test_reports_a_spec_which_fails_to_import_and_carries_on(self):
+        self.write_spec("lazy_spec_bad", BAD_SPEC)
+        result = self.run_suite()
+        self.assertEqual(result.testsRun, self.count + 1)
+        self.assertEqual(len(result.errors), 1)
+        self.assertTrue("lazy_spec_bad" in result.errors[0][1])
+
+    def test_runs_class_fixtures_once_per_class(self):
+        with open(os.path.join(self.output_dir, "lazy_fixture_calls.py"),
+                  'w') as f:
+            f.write(FIXTURE_MODULE)
+        for i in range(self.count):
+            self.write_spec("lazy_fixture_spec_{0}".format(i),
+                            FIXTURE_SPEC.format(i))
+        self.run_suite()
+
+        from lazy_fixture_calls import CALLS
+        names = ["TestFixtureSpec{0}".format(i) for i in range(self.count)]
+        for name in names:
+            self.assertEqual(CALLS.count(("setUpClass", name)), 1)
+            self.assertEqual(CALLS.count(("tearDownClass", name)), 1)
+        self.assertEqual(len(CALLS), 2 * len(names))
+
+    def test_stops_generating_once_the_result_should_stop(self):
+        # Separate directories, since they are searched in the order given
+        failing_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, failing_dir)
+        with open(os.path.join(failing_dir, "lazy_spec_fails.carinata"),
+                  'w') as f:
+            f.write(FAILING_SPEC)
+        result = self.run_suite(failfast=True,
+                                directories=[failing_dir, self.spec_dir])
+        self.assertEqual(result.testsRun, 1)
+        self.assertEqual(os.listdir(self.output_dir), ["lazy_spec_fails.py"])
+
+    def test_refuses_extra_tests(self):
+        suite = SuiteGenerator([self.spec_dir]).create_test_suite()
+        self.assertRaises(TypeError, suite.addTest, self)
+
+
+if __name__ == '__main__':
+    unittest.main()